@@ -0,0 +1,59 @@
+"""Tests for utils.config."""
+
+import os
+
+import pytest
+
+from utils.config import Settings, load_toml_config
+
+
+class TestLoadTomlConfig:
+    def test_loads_sections(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text('[runtime]\nmax_view_entries = 5\n')
+        assert load_toml_config(path) == {"runtime": {"max_view_entries": 5}}
+
+    def test_bare_carriage_return_is_invalid(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_bytes(b"a = 1\rb = 2\n")
+        with pytest.raises(ValueError):
+            load_toml_config(path)
+
+    def test_invalid_utf8_is_invalid(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_bytes(b'a = "\xff"\n')
+        with pytest.raises(ValueError):
+            load_toml_config(path)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_toml_config(tmp_path / "config.toml")
+
+    def test_parent_is_a_file(self, tmp_path):
+        (tmp_path / "afile").write_text("")
+        with pytest.raises(FileNotFoundError):
+            load_toml_config(tmp_path / "afile" / "config.toml")
+
+
+class TestSettings:
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        for name in list(os.environ):
+            if name.startswith("MEMOGARDEN_"):
+                monkeypatch.delenv(name)
+
+    def test_missing_config_uses_defaults(self, tmp_path):
+        settings = Settings(config_path=tmp_path / "config.toml")
+        assert settings.max_view_entries == Settings.DEFAULTS["max_view_entries"]
+
+    def test_parent_is_a_file_uses_defaults(self, tmp_path):
+        (tmp_path / "afile").write_text("")
+        settings = Settings(config_path=tmp_path / "afile" / "config.toml")
+        assert settings.max_view_entries == Settings.DEFAULTS["max_view_entries"]
+
+    def test_toml_overrides_defaults(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text('[runtime]\nmax_view_entries = 5\n\n[network]\nbind_port = 9000\n')
+        settings = Settings(config_path=path)
+        assert settings.max_view_entries == 5
+        assert settings.bind_port == 9000
@@ -0,0 +1,60 @@
+"""Tests for utils.hash_chain."""
+
+import sqlite3
+
+import pytest
+
+from utils.hash_chain import compute_entity_hash, compute_entity_hashes_batch
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE entity (type, created_at, updated_at, group_id,"
+        " derived_from, superseded_by, superseded_at, previous_hash)"
+    )
+    conn.executemany(
+        "INSERT INTO entity VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("transactions", "2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z",
+             "g1", "d1", "s1", "2025-01-03T00:00:00Z", "abc"),
+            ("users", "2025-02-01T00:00:00Z", "2025-02-01T00:00:00Z",
+             None, None, None, None, None),
+        ],
+    )
+    yield conn
+    conn.close()
+
+
+class TestComputeEntityHashesBatch:
+    def test_full_columns_match_single_hash(self, db):
+        rows = db.execute("SELECT * FROM entity").fetchall()
+        assert compute_entity_hashes_batch(rows) == [
+            compute_entity_hash(*tuple(row)) for row in rows
+        ]
+
+    def test_missing_optional_columns_hash_as_empty(self, db):
+        rows = db.execute(
+            "SELECT type, created_at, updated_at, group_id, previous_hash FROM entity"
+        ).fetchall()
+        assert compute_entity_hashes_batch(rows) == [
+            compute_entity_hash(
+                "transactions", "2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z",
+                group_id="g1", previous_hash="abc",
+            ),
+            compute_entity_hash(
+                "users", "2025-02-01T00:00:00Z", "2025-02-01T00:00:00Z",
+            ),
+        ]
+
+    @pytest.mark.parametrize("missing", ["type", "created_at", "updated_at"])
+    def test_missing_required_column_raises(self, db, missing):
+        columns = [c for c in ("type", "created_at", "updated_at") if c != missing]
+        rows = db.execute(f"SELECT {', '.join(columns)} FROM entity").fetchall()
+        with pytest.raises(IndexError):
+            compute_entity_hashes_batch(rows)
+
+    def test_empty(self):
+        assert compute_entity_hashes_batch([]) == []
@@ -0,0 +1,259 @@
+"""Tests for utils.recurrence."""
+
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+import pytest
+from dateutil.rrule import rrulestr
+
+from utils.recurrence import (
+    MAX_OCCURRENCES,
+    generate_occurrences,
+    get_next_occurrence,
+    is_valid_recurrence_window,
+    iter_occurrences,
+    validate_rrule,
+)
+
+
+class TestValidateRrule:
+    @pytest.mark.parametrize(
+        "rrule_str",
+        [
+            "FREQ=MONTHLY;BYDAY=2FR",
+            "RRULE:FREQ=WEEKLY;INTERVAL=2",
+            "INTERVAL=2;FREQ=DAILY",
+            "freq=daily",
+            "DTSTART:20250101T000000\nRRULE:FREQ=DAILY",
+        ],
+    )
+    def test_valid(self, rrule_str):
+        assert validate_rrule(rrule_str)
+
+    @pytest.mark.parametrize(
+        "rrule_str",
+        [
+            "",
+            "INVALID",
+            "FREQ=SOMETIMES",
+            "BYMONTHDAY=-1",
+            "DTSTART:20250101",
+            "FREQ=DAILY;UNTIL=99999999999999999999",
+            "FREQ=DAILY;BYHOUR=99999999999999999999999",
+        ],
+    )
+    def test_invalid_returns_false(self, rrule_str):
+        assert validate_rrule(rrule_str) is False
+
+
+class TestGenerateOccurrences:
+    def test_count(self):
+        start = datetime(2025, 1, 1)
+        result = generate_occurrences("FREQ=MONTHLY;BYDAY=2FR", start, count=3)
+        assert result == [
+            datetime(2025, 1, 10),
+            datetime(2025, 2, 14),
+            datetime(2025, 3, 14),
+        ]
+
+    def test_end_is_exclusive_and_start_inclusive(self):
+        result = generate_occurrences(
+            "FREQ=DAILY", datetime(2025, 1, 1), end=datetime(2025, 1, 4)
+        )
+        assert result == [
+            datetime(2025, 1, 1),
+            datetime(2025, 1, 2),
+            datetime(2025, 1, 3),
+        ]
+
+    def test_count_and_end_compose(self):
+        start = datetime(2025, 1, 1)
+        by_count = generate_occurrences("FREQ=DAILY", start, end=datetime(2025, 3, 1), count=5)
+        by_end = generate_occurrences("FREQ=DAILY", start, end=datetime(2025, 1, 3), count=5)
+        assert len(by_count) == 5
+        assert len(by_end) == 2
+
+    def test_default_limit(self):
+        assert len(generate_occurrences("FREQ=DAILY", datetime(2025, 1, 1))) == 100
+
+    def test_max_count_caps_default_limit(self):
+        assert len(generate_occurrences("FREQ=DAILY", datetime(2025, 1, 1), max_count=10)) == 10
+
+    @pytest.mark.parametrize(
+        "rrule_str, expected",
+        [
+            ("FREQ=DAILY;BYHOUR=0", [datetime(2025, 1, 1), datetime(2025, 1, 2)]),
+            ("FREQ=MONTHLY", [datetime(2025, 1, 1), datetime(2025, 2, 1)]),
+            ("FREQ=WEEKLY;BYDAY=WE", [datetime(2025, 1, 1), datetime(2025, 1, 8)]),
+        ],
+    )
+    def test_sub_second_start_keeps_first_occurrence(self, rrule_str, expected):
+        start = datetime(2025, 1, 1, 0, 0, 0, 500)
+        assert generate_occurrences(rrule_str, start, count=2) == expected
+
+    def test_max_count_caps_end_only_queries(self):
+        result = generate_occurrences(
+            "FREQ=HOURLY", datetime(2000, 1, 1), end=datetime(2025, 1, 1)
+        )
+        assert len(result) == MAX_OCCURRENCES
+
+    def test_explicit_count_is_not_capped(self):
+        result = generate_occurrences("FREQ=DAILY", datetime(2025, 1, 1), count=5000)
+        assert len(result) == 5000
+
+    def test_embedded_dtstart_is_bounded_by_start(self):
+        result = generate_occurrences(
+            "DTSTART:20200101T000000\nRRULE:FREQ=DAILY",
+            datetime(2025, 1, 1),
+            end=datetime(2025, 1, 5),
+        )
+        assert result == [
+            datetime(2025, 1, 1),
+            datetime(2025, 1, 2),
+            datetime(2025, 1, 3),
+            datetime(2025, 1, 4),
+        ]
+
+    def test_embedded_dtstart_count_starts_at_start(self):
+        result = generate_occurrences(
+            "DTSTART:20200101T000000\nRRULE:FREQ=WEEKLY;BYDAY=MO",
+            datetime(2025, 1, 1),
+            count=2,
+        )
+        assert result == [datetime(2025, 1, 6), datetime(2025, 1, 13)]
+
+    def test_dtstart_keeps_interval_alignment(self):
+        # Every other day from Jan 1; a window starting Jan 2 skips to Jan 3
+        result = generate_occurrences(
+            "FREQ=DAILY;INTERVAL=2",
+            datetime(2025, 1, 2),
+            count=2,
+            dtstart=datetime(2025, 1, 1),
+        )
+        assert result == [datetime(2025, 1, 3), datetime(2025, 1, 5)]
+
+    def test_dtstart_with_by_rules(self):
+        result = generate_occurrences(
+            "FREQ=MONTHLY;BYMONTHDAY=15",
+            datetime(2025, 3, 1),
+            count=2,
+            dtstart=datetime(2025, 1, 15),
+        )
+        assert result == [datetime(2025, 3, 15), datetime(2025, 4, 15)]
+
+
+class TestIterOccurrences:
+    def test_lazy_unbounded(self):
+        it = iter_occurrences("FREQ=DAILY", datetime(2025, 1, 1))
+        assert next(it) == datetime(2025, 1, 1)
+        assert next(it) == datetime(2025, 1, 2)
+
+    def test_embedded_dtstart_is_bounded_by_start(self):
+        it = iter_occurrences(
+            "DTSTART:20200101T000000\nRRULE:FREQ=DAILY", datetime(2025, 1, 1)
+        )
+        assert next(it) == datetime(2025, 1, 1)
+
+
+class TestFixedStepPath:
+    """DAILY/WEEKLY rules skip dateutil; results must match it exactly."""
+
+    @staticmethod
+    def reference(rrule_str, start, count, dtstart=None):
+        rule = rrulestr(rrule_str, dtstart=dtstart or start)
+        return list(islice(rule.xafter(start.replace(microsecond=0), inc=True), count))
+
+    @pytest.mark.parametrize(
+        "rrule_str",
+        ["FREQ=DAILY", "FREQ=WEEKLY", "RRULE:FREQ=DAILY;INTERVAL=3", "freq=weekly;interval=2"],
+    )
+    @pytest.mark.parametrize(
+        "start, dtstart",
+        [
+            (datetime(2025, 1, 1), None),
+            (datetime(2025, 1, 1, 0, 0, 0, 500), None),
+            (datetime(2025, 3, 10, 12, 30, 0, 999999), datetime(2025, 1, 1, 12, 30)),
+            (datetime(2025, 1, 1, 0, 0, 0, 500), datetime(2025, 1, 1)),
+            (datetime(2025, 1, 1), datetime(2024, 12, 31, 23, 59, 59, 250)),
+        ],
+    )
+    def test_matches_dateutil(self, rrule_str, start, dtstart):
+        result = generate_occurrences(rrule_str, start, count=5, dtstart=dtstart)
+        assert result == self.reference(rrule_str, start, 5, dtstart)
+
+    def test_aware(self):
+        tz = timezone(timedelta(hours=8))
+        start = datetime(2025, 1, 1, 9, 0, 0, 1, tzinfo=tz)
+        result = generate_occurrences("FREQ=DAILY", start, count=3)
+        assert result == self.reference("FREQ=DAILY", start, 3)
+
+    def test_sub_second_start_agrees_with_dateutil_path(self):
+        # Same series through the fast path and through dateutil (BYHOUR)
+        start = datetime(2025, 1, 1, 0, 0, 0, 500)
+        fast = generate_occurrences("FREQ=DAILY", start, count=2)
+        slow = generate_occurrences("FREQ=DAILY;BYHOUR=0", start, count=2)
+        assert fast == slow == [datetime(2025, 1, 1), datetime(2025, 1, 2)]
+
+
+class TestGetNextOccurrence:
+    def test_excludes_after(self):
+        result = get_next_occurrence("FREQ=DAILY", datetime(2025, 1, 1))
+        assert result == datetime(2025, 1, 2)
+
+    def test_embedded_dtstart(self):
+        result = get_next_occurrence(
+            "DTSTART:20200101T000000\nRRULE:FREQ=DAILY", datetime(2025, 1, 1, 12)
+        )
+        assert result == datetime(2025, 1, 2)
+
+    def test_exhausted_rule(self):
+        result = get_next_occurrence(
+            "FREQ=DAILY;COUNT=2", datetime(2025, 1, 5), dtstart=datetime(2025, 1, 1)
+        )
+        assert result is None
+
+
+class TestRuleCache:
+    def test_same_instant_different_timezones(self):
+        utc = timezone.utc
+        plus_one = timezone(timedelta(hours=1))
+        rule = "FREQ=DAILY;BYHOUR=9;BYMINUTE=0;BYSECOND=0"
+
+        first = generate_occurrences(rule, datetime(2025, 1, 1, 12, tzinfo=utc), count=1)
+        second = generate_occurrences(rule, datetime(2025, 1, 1, 13, tzinfo=plus_one), count=1)
+
+        assert first == [datetime(2025, 1, 2, 9, tzinfo=utc)]
+        assert second == [datetime(2025, 1, 2, 9, tzinfo=plus_one)]
+        assert second[0].tzinfo is plus_one
+
+
+class TestIsValidRecurrenceWindow:
+    def test_open_ended(self):
+        assert is_valid_recurrence_window("2025-01-01T00:00:00Z", None)
+
+    def test_ordered(self):
+        assert is_valid_recurrence_window("2025-01-01T00:00:00Z", "2025-02-01T00:00:00Z")
+        assert not is_valid_recurrence_window("2025-02-01T00:00:00Z", "2025-01-01T00:00:00Z")
+
+    def test_leap_day(self):
+        assert is_valid_recurrence_window("2024-02-29T00:00:00Z", None)
+
+    @pytest.mark.parametrize(
+        "valid_from",
+        ["2025-02-30T00:00:00Z", "2025-04-31T00:00:00Z", "0000-01-01T00:00:00Z", "garbage"],
+    )
+    def test_invalid_from_raises(self, valid_from):
+        with pytest.raises(ValueError):
+            is_valid_recurrence_window(valid_from, None)
+
+    @pytest.mark.parametrize(
+        "valid_until",
+        ["2025-02-31T00:00:00Z", "2025-13-01T00:00:00Z", "2025-06-31T00:00:00Z"],
+    )
+    def test_invalid_until_raises(self, valid_until):
+        with pytest.raises(ValueError):
+            is_valid_recurrence_window("2025-02-01T00:00:00Z", valid_until)
+
+    def test_mixed_layouts_are_parsed(self):
+        assert is_valid_recurrence_window("2025-01-01T00:00:00Z", "2025-01-01T00:00:00.5+00:00")
+        assert not is_valid_recurrence_window("2025-01-01T01:00:00+00:00", "2025-01-01T00:30:00Z")
@@ -0,0 +1,64 @@
+"""Tests for utils.secret."""
+
+import secrets
+import string
+
+import pytest
+
+from utils.secret import (
+    PASSWORD_ALPHABET,
+    generate_password,
+    generate_token,
+    generate_tokens,
+)
+
+
+HEX_DIGITS = set(string.hexdigits.lower())
+
+
+class TestGenerateTokens:
+    def test_lengths(self):
+        tokens = generate_tokens(5, num_bytes=16)
+        assert len(tokens) == 5
+        assert len(set(tokens)) == 5
+        for token in tokens:
+            assert len(token) == 32
+            assert set(token) <= HEX_DIGITS
+
+    def test_default_matches_generate_token(self):
+        tokens = generate_tokens(3)
+        assert [len(t) for t in tokens] == [len(generate_token())] * 3
+
+    def test_zero_tokens(self):
+        assert generate_tokens(0) == []
+
+    def test_zero_bytes(self):
+        assert generate_tokens(3, num_bytes=0) == [""] * 3
+        assert generate_token(0) == ""
+
+
+class TestGeneratePassword:
+    @pytest.mark.parametrize("length", [0, 1, 16, 5000])
+    def test_exact_length_from_alphabet(self, length):
+        password = generate_password(length)
+        assert len(password) == length
+        assert set(password) <= set(PASSWORD_ALPHABET.decode())
+
+    def test_default_length(self):
+        assert len(generate_password()) == 16
+
+    def test_masked_values_past_alphabet_are_rejected(self, monkeypatch):
+        # Feed every byte value once. Bytes whose low 6 bits are 62 or 63
+        # must be dropped, never mapped to a character.
+        monkeypatch.setattr(secrets, "token_bytes", lambda n: bytes(range(256)))
+
+        password = generate_password(248)
+
+        accepted = [b for b in range(256) if (b & 0x3F) < 62]
+        assert len(accepted) == 248
+        assert password == "".join(chr(PASSWORD_ALPHABET[b & 0x3F]) for b in accepted)
+
+    def test_all_rejected_draw_is_retried(self, monkeypatch):
+        draws = iter([bytes([62, 63, 126, 127, 254, 255] * 4), b"\x00\x01\x02\x03"])
+        monkeypatch.setattr(secrets, "token_bytes", lambda n: next(draws))
+        assert generate_password(2) == "ab"
@@ -0,0 +1,37 @@
+"""Tests for utils.uid."""
+
+import uuid
+
+from utils.uid import generate_uuid, generate_uuid_bytes, generate_uuids
+
+
+def assert_uuid4(value: uuid.UUID):
+    assert value.version == 4
+    assert value.variant == uuid.RFC_4122
+
+
+class TestGenerateUuid:
+    def test_is_uuid4(self):
+        u = generate_uuid()
+        assert len(u) == 36
+        assert_uuid4(uuid.UUID(u))
+        assert str(uuid.UUID(u)) == u
+
+    def test_bytes_is_uuid4(self):
+        b = generate_uuid_bytes()
+        assert len(b) == 16
+        assert_uuid4(uuid.UUID(bytes=b))
+
+
+class TestGenerateUuids:
+    def test_batch_is_uuid4(self):
+        uuids = generate_uuids(500)
+        assert len(uuids) == 500
+        assert len(set(uuids)) == 500
+        for u in uuids:
+            assert len(u) == 36
+            assert_uuid4(uuid.UUID(u))
+            assert str(uuid.UUID(u)) == u
+
+    def test_zero(self):
+        assert generate_uuids(0) == []
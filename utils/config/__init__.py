@@ -5,12 +5,34 @@ multiple deployment contexts.
 
 Import patterns:
     from utils.config import Settings, get_config_path, ResourceProfile
+    from utils.config import get_default_settings
 """
 
 from .base import Settings, get_config_path, load_toml_config
 from .profiles import ResourceProfile
 
-__all__ = ["Settings", "get_config_path", "load_toml_config", "ResourceProfile"]
+__all__ = [
+    "Settings",
+    "get_config_path",
+    "get_default_settings",
+    "load_toml_config",
+    "ResourceProfile",
+]
 
-# Default settings instance
-default_settings = Settings()
+# Default settings instance, built on first use rather than at import
+_default_settings: Settings | None = None
+
+
+def get_default_settings() -> Settings:
+    """Get the shared default Settings instance, creating it on first call."""
+    global _default_settings
+    if _default_settings is None:
+        _default_settings = Settings()
+    return _default_settings
+
+
+def __getattr__(name: str):
+    # Keep `utils.config.default_settings` working without eager construction
+    if name == "default_settings":
+        return get_default_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
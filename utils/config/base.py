@@ -10,11 +10,17 @@ Configuration Resolution Order (RFC 004):
 4. Built-in defaults
 """
 
+import copy
 import os
 import sys
+from functools import lru_cache
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, Any
 
+from .profiles import ResourceProfile
+
 # Python 3.11+ has tomllib in stdlib, otherwise use tomli
 if sys.version_info >= (3, 11):
     import tomllib
@@ -24,10 +30,51 @@ else:
     except ImportError:
         tomllib = None
 
+# Optional Rust-backed parser, used in preference to tomllib when installed
+try:
+    import rtoml
+except ImportError:
+    rtoml = None
+
+if rtoml is not None:
+    _toml_loads = rtoml.loads
+elif tomllib is not None:
+    _toml_loads = tomllib.loads
+else:
+    _toml_loads = None
+
+
+@lru_cache(maxsize=8)
+def _cached_toml(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a TOML file, memoized by path, modification time and size.
+
+    Callers must not mutate the returned dict; it is shared by the cache.
+    """
+    if _toml_loads is None:
+        raise ImportError(
+            "tomli is required for Python < 3.11. "
+            "Install it with: pip install tomli"
+        )
+
+    # Read bytes and decode explicitly: text mode would translate bare \r
+    # newlines and let invalid TOML through
+    with open(path_str, "rb") as f:
+        data = f.read()
+    try:
+        config = _toml_loads(data.decode("utf-8"))
+    except Exception as e:
+        raise ValueError(f"Invalid TOML in {path_str}: {e}")
+
+    return config
+
 
 def load_toml_config(config_path: Path) -> dict[str, Any]:
     """Load configuration from TOML file.
 
+    Parsed results are cached per process, keyed by path and mtime, so
+    repeated loads of an unchanged file skip reading and parsing it.
+    Uses rtoml when installed, otherwise tomllib (tomli on Python < 3.11).
+
     Args:
         config_path: Path to config.toml file
 
@@ -39,20 +86,31 @@ def load_toml_config(config_path: Path) -> dict[str, Any]:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config file is invalid TOML
     """
-    if tomllib is None:
-        raise ImportError(
-            "tomli is required for Python < 3.11. "
-            "Install it with: pip install tomli"
-        )
-
-    if not config_path.exists():
+    try:
+        st = os.stat(config_path)
+    except (FileNotFoundError, NotADirectoryError):
+        # A file where a parent directory should be also means no config
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "rb") as f:
-        try:
-            return tomllib.load(f)
-        except Exception as e:
-            raise ValueError(f"Invalid TOML in {config_path}: {e}")
+    return copy.deepcopy(_cached_toml(str(config_path), st.st_mtime_ns, st.st_size))
+
+
+# Shared stand-in for TOML sections absent from the config file
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+# Fixed system locations for the serve and deploy contexts
+_SERVE_CONFIG_PATH = Path("/etc/memogarden/config.toml")
+_DEPLOY_CONFIG_PATH = Path("/config/config.toml")
+
+
+@lru_cache(maxsize=1)
+def _user_config_path() -> Path:
+    """Get the per-user config path.
+
+    Cached because Path.home() may query the password database, and the
+    home directory does not change during a process lifetime.
+    """
+    return Path.home() / ".config/memogarden/config.toml"
 
 
 def get_config_path(verb: str = "run", config_override: Optional[Path] = None) -> Path:
@@ -76,14 +134,12 @@ def get_config_path(verb: str = "run", config_override: Optional[Path] = None) -
         return config_override
 
     if verb == "serve":
-        return Path("/etc/memogarden/config.toml")
-    elif verb == "run":
-        return Path.home() / ".config/memogarden/config.toml"
+        return _SERVE_CONFIG_PATH
     elif verb == "deploy":
-        return Path("/config/config.toml")
+        return _DEPLOY_CONFIG_PATH
     else:
-        # Default to user config
-        return Path.home() / ".config/memogarden/config.toml"
+        # run, and default to user config
+        return _user_config_path()
 
 
 class Settings:
@@ -98,6 +154,12 @@ class Settings:
     2. TOML config file (if exists)
     3. Resource profile defaults
     4. Built-in defaults
+
+    Access:
+    - Known settings are always set and should be read as plain attributes
+      (e.g. settings.max_view_entries)
+    - Use get() for dynamic keys or settings that may be absent
+      (e.g. data_dir, or runtime keys only present in the TOML file)
     """
 
     # Built-in defaults (standard profile)
@@ -112,6 +174,25 @@ class Settings:
         "encryption": "disabled",
     }
 
+    # Environment variable overrides: (variable, attribute, converter)
+    _ENV_SPEC = (
+        # Runtime settings
+        ("MEMOGARDEN_MAX_VIEW_ENTRIES", "max_view_entries", int),
+        ("MEMOGARDEN_MAX_SEARCH_RESULTS", "max_search_results", int),
+        ("MEMOGARDEN_FOSSILIZATION_THRESHOLD", "fossilization_threshold", float),
+        ("MEMOGARDEN_WAL_CHECKPOINT_INTERVAL", "wal_checkpoint_interval", int),
+        ("MEMOGARDEN_LOG_LEVEL", "log_level", str),
+        # Network settings
+        ("MEMOGARDEN_BIND_ADDRESS", "bind_address", str),
+        ("MEMOGARDEN_BIND_PORT", "bind_port", int),
+        # Security settings
+        ("MEMOGARDEN_ENCRYPTION", "encryption", str),
+        # Path settings
+        ("MEMOGARDEN_DATA_DIR", "data_dir", Path),
+        ("MEMOGARDEN_CONFIG_DIR", "config_dir", Path),
+        ("MEMOGARDEN_LOG_DIR", "log_dir", Path),
+    )
+
     def __init__(
         self,
         database_path: Optional[str] = None,
@@ -131,9 +212,9 @@ class Settings:
         self.database_path = database_path
         self.default_currency = default_currency
 
-        # Initialize all defaults first
-        for key, value in self.DEFAULTS.items():
-            setattr(self, key, value)
+        # Initialize all defaults first. Settings has no descriptors, so
+        # batch-updating the instance dict is equivalent to setattr per key.
+        self.__dict__.update(self.DEFAULTS)
 
         # Set default resource profile
         self._resource_profile = "standard"
@@ -145,15 +226,17 @@ class Settings:
         if config_path is None:
             config_path = get_config_path(verb)
 
-        # Load TOML first (will be overridden by env vars later)
-        if config_path.exists():
-            try:
-                self._config = load_toml_config(config_path)
-                self._apply_toml_config()
-            except (ImportError, ValueError) as e:
-                # Log warning but continue with defaults
-                import warnings
-                warnings.warn(f"Failed to load config from {config_path}: {e}")
+        # Load TOML first (will be overridden by env vars later).
+        # A missing file is the common case; don't stat it separately.
+        try:
+            self._config = load_toml_config(config_path)
+            self._apply_toml_config()
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        except (ImportError, ValueError) as e:
+            # Log warning but continue with defaults
+            import warnings
+            warnings.warn(f"Failed to load config from {config_path}: {e}")
 
         # Apply environment variables (highest precedence)
         self._apply_env_vars()
@@ -168,96 +251,71 @@ class Settings:
         4. Security settings
         5. Path overrides
         """
-        from .profiles import ResourceProfile
+        config = self._config
+        runtime_config = config.get("runtime") or _EMPTY_SECTION
+        network_config = config.get("network") or _EMPTY_SECTION
+        security_config = config.get("security") or _EMPTY_SECTION
+        paths_config = config.get("paths") or _EMPTY_SECTION
 
         # Get resource profile
-        runtime_config = self._config.get("runtime", {})
         resource_profile = runtime_config.get("resource_profile", "standard")
         self._resource_profile = resource_profile
         profile_settings = ResourceProfile.get_profile(resource_profile)
 
         # Apply profile settings (can be overridden by explicit values)
-        for key, value in profile_settings.items():
-            setattr(self, key, value)
+        self.__dict__.update(profile_settings)
 
         # Apply runtime overrides
-        for key, value in runtime_config.items():
-            if key != "resource_profile":
-                setattr(self, key, value)
+        self.__dict__.update(
+            (key, value)
+            for key, value in runtime_config.items()
+            if key != "resource_profile"
+        )
 
         # Apply network settings
-        network_config = self._config.get("network", {})
-        if "bind_address" in network_config:
-            self.bind_address = network_config["bind_address"]
-        if "bind_port" in network_config:
-            self.bind_port = network_config["bind_port"]
+        if network_config is not _EMPTY_SECTION:
+            if "bind_address" in network_config:
+                self.bind_address = network_config["bind_address"]
+            if "bind_port" in network_config:
+                self.bind_port = network_config["bind_port"]
 
         # Apply security settings
-        security_config = self._config.get("security", {})
         if "encryption" in security_config:
             self.encryption = security_config["encryption"]
 
         # Apply path overrides (optional)
-        paths_config = self._config.get("paths", {})
-        if paths_config.get("data_dir"):
-            self.data_dir = Path(paths_config["data_dir"])
-        if paths_config.get("config_dir"):
-            self.config_dir = Path(paths_config["config_dir"])
-        if paths_config.get("log_dir"):
-            self.log_dir = Path(paths_config["log_dir"])
+        if paths_config is not _EMPTY_SECTION:
+            if paths_config.get("data_dir"):
+                self.data_dir = Path(paths_config["data_dir"])
+            if paths_config.get("config_dir"):
+                self.config_dir = Path(paths_config["config_dir"])
+            if paths_config.get("log_dir"):
+                self.log_dir = Path(paths_config["log_dir"])
 
     def _apply_env_vars(self):
         """Apply environment variables to settings.
 
-        Environment variables take highest precedence.
+        Environment variables take highest precedence. The resource profile
+        is applied first so individual variables can override its values.
         """
-        # Runtime settings from env
-        if "MEMOGARDEN_RESOURCE_PROFILE" in os.environ:
-            profile = os.environ["MEMOGARDEN_RESOURCE_PROFILE"]
-            self._resource_profile = profile
-            from .profiles import ResourceProfile
-            profile_settings = ResourceProfile.get_profile(profile)
-            for key, value in profile_settings.items():
-                setattr(self, key, value)
+        env = os.environ
 
-        if "MEMOGARDEN_MAX_VIEW_ENTRIES" in os.environ:
-            self.max_view_entries = int(os.environ["MEMOGARDEN_MAX_VIEW_ENTRIES"])
-
-        if "MEMOGARDEN_MAX_SEARCH_RESULTS" in os.environ:
-            self.max_search_results = int(os.environ["MEMOGARDEN_MAX_SEARCH_RESULTS"])
-
-        if "MEMOGARDEN_FOSSILIZATION_THRESHOLD" in os.environ:
-            self.fossilization_threshold = float(os.environ["MEMOGARDEN_FOSSILIZATION_THRESHOLD"])
-
-        if "MEMOGARDEN_WAL_CHECKPOINT_INTERVAL" in os.environ:
-            self.wal_checkpoint_interval = int(os.environ["MEMOGARDEN_WAL_CHECKPOINT_INTERVAL"])
-
-        if "MEMOGARDEN_LOG_LEVEL" in os.environ:
-            self.log_level = os.environ["MEMOGARDEN_LOG_LEVEL"]
-
-        # Network settings from env
-        if "MEMOGARDEN_BIND_ADDRESS" in os.environ:
-            self.bind_address = os.environ["MEMOGARDEN_BIND_ADDRESS"]
-
-        if "MEMOGARDEN_BIND_PORT" in os.environ:
-            self.bind_port = int(os.environ["MEMOGARDEN_BIND_PORT"])
-
-        # Security settings from env
-        if "MEMOGARDEN_ENCRYPTION" in os.environ:
-            self.encryption = os.environ["MEMOGARDEN_ENCRYPTION"]
-
-        # Path settings from env
-        if "MEMOGARDEN_DATA_DIR" in os.environ:
-            self.data_dir = Path(os.environ["MEMOGARDEN_DATA_DIR"])
-
-        if "MEMOGARDEN_CONFIG_DIR" in os.environ:
-            self.config_dir = Path(os.environ["MEMOGARDEN_CONFIG_DIR"])
+        profile = env.get("MEMOGARDEN_RESOURCE_PROFILE")
+        if profile is not None:
+            self._resource_profile = profile
+            self.__dict__.update(ResourceProfile.get_profile(profile))
 
-        if "MEMOGARDEN_LOG_DIR" in os.environ:
-            self.log_dir = Path(os.environ["MEMOGARDEN_LOG_DIR"])
+        for name, attr, convert in self._ENV_SPEC:
+            value = env.get(name)
+            if value is not None:
+                setattr(self, attr, convert(value))
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Get a configuration value.
+        """Get a configuration value by name.
+
+        Prefer plain attribute access for known settings; this is for
+        dynamic keys. Settings live in the instance dict, so a dict lookup
+        avoids getattr's AttributeError path for missing keys.
 
         Args:
             key: Configuration key
@@ -266,4 +324,4 @@ class Settings:
         Returns:
             Configuration value or default
         """
-        return getattr(self, key, default)
+        return self.__dict__.get(key, default)
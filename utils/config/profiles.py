@@ -3,6 +3,8 @@
 Profiles are operator-declared, not hardware-detected.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 
@@ -12,32 +14,34 @@ class ResourceProfile:
     Profiles are operator-declared, not hardware-detected.
     """
 
-    PROFILES = {
-        "embedded": {
+    # Profiles are read-only so get_profile can hand them out without copying
+    PROFILES: dict[str, Mapping[str, Any]] = {
+        "embedded": MappingProxyType({
             "max_view_entries": 100,
             "max_search_results": 20,
             "fossilization_threshold": 0.80,
             "wal_checkpoint_interval": 300,
             "log_level": "warning",
-        },
-        "standard": {
+        }),
+        "standard": MappingProxyType({
             "max_view_entries": 1000,
             "max_search_results": 100,
             "fossilization_threshold": 0.90,
             "wal_checkpoint_interval": 60,
             "log_level": "info",
-        },
+        }),
     }
 
     @classmethod
-    def get_profile(cls, name: str) -> dict[str, Any]:
+    def get_profile(cls, name: str) -> Mapping[str, Any]:
         """Get resource profile settings.
 
         Args:
             name: Profile name (embedded or standard)
 
         Returns:
-            Dictionary with profile settings
+            Read-only mapping with profile settings (use dict() for a
+            mutable copy)
 
         Raises:
             ValueError: If profile name is unknown
@@ -47,4 +51,4 @@ class ResourceProfile:
                 f"Unknown resource profile: {name}. "
                 f"Available: {list(cls.PROFILES.keys())}"
             )
-        return cls.PROFILES[name].copy()
+        return cls.PROFILES[name]
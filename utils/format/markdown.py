@@ -3,6 +3,13 @@
 
 import argparse
 import sys
+from functools import lru_cache
+
+
+def _format_line(line: str) -> str:
+    """Format a "Key: value" line with a bold key; pass other lines through."""
+    key, sep, value = line.partition(": ")
+    return f"**{key}:** {value}" if sep else line
 
 
 def format_markdown(title: str, body_lines: list[str]) -> str:
@@ -15,18 +22,12 @@ def format_markdown(title: str, body_lines: list[str]) -> str:
     Returns:
         Formatted markdown as a string
     """
-    result = [f"### {title}", ""]
-    for line in body_lines:
-        # Format "Key: value" lines as bold keys
-        if ": " in line:
-            key, value = line.split(": ", 1)
-            result.append(f"**{key}:** {value}")
-        else:
-            result.append(line)
-    return "\n".join(result)
+    return "\n".join([f"### {title}", "", *map(_format_line, body_lines)])
 
 
-def main() -> None:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; reused across in-process main() calls."""
     parser = argparse.ArgumentParser(
         description="Format text in markdown"
     )
@@ -41,8 +42,11 @@ def main() -> None:
         required=True,
         help="Body content lines (one or more)"
     )
+    return parser
 
-    args = parser.parse_args()
+
+def main() -> None:
+    args = _build_parser().parse_args()
 
     output = format_markdown(args.title, args.body)
     print(output)
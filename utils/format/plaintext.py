@@ -3,6 +3,7 @@
 
 import argparse
 import sys
+from functools import lru_cache
 
 
 def format_plaintext(title: str, body_lines: list[str]) -> str:
@@ -15,12 +16,12 @@ def format_plaintext(title: str, body_lines: list[str]) -> str:
     Returns:
         Formatted text as a string
     """
-    result = [title, ""]
-    result.extend(body_lines)
-    return "\n".join(result)
+    return "\n".join([title, "", *body_lines])
 
 
-def main() -> None:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; reused across in-process main() calls."""
     parser = argparse.ArgumentParser(
         description="Format text in plain text (no borders)"
     )
@@ -35,8 +36,11 @@ def main() -> None:
         required=True,
         help="Body content lines (one or more)"
     )
+    return parser
+
 
-    args = parser.parse_args()
+def main() -> None:
+    args = _build_parser().parse_args()
 
     output = format_plaintext(args.title, args.body)
     print(output)
@@ -4,12 +4,19 @@
 import argparse
 import sys
 import unicodedata
+from functools import lru_cache
+
+
+_WIDE = frozenset(('W', 'F'))
 
 
 def display_width(s: str) -> int:
     """Get display width of string, accounting for multi-byte characters."""
-    return sum(2 if unicodedata.east_asian_width(c) in ('W', 'F') else 1
-               for c in s)
+    # ASCII is always one column per character; skip unicodedata entirely
+    if s.isascii():
+        return len(s)
+    eaw = unicodedata.east_asian_width
+    return sum(2 if eaw(c) in _WIDE else 1 for c in s)
 
 
 def format_box(title: str, body_lines: list[str], min_width: int = 60) -> str:
@@ -24,26 +31,33 @@ def format_box(title: str, body_lines: list[str], min_width: int = 60) -> str:
         Formatted box as a string
     """
     all_lines = [title] + body_lines
-    content_width = max((display_width(line) for line in all_lines), default=0)
+    widths = [display_width(line) for line in all_lines]
+    content_width = max(widths, default=0)
     width = max(min_width, content_width + 4)  # +4 for side padding
 
-    # Helper to pad a line
-    def pad(line: str) -> str:
-        needed = width - display_width(line) - 2  # -2 for border chars
+    # Helper to pad a line of known display width
+    def pad(line: str, line_width: int) -> str:
+        needed = width - line_width - 2  # -2 for border chars
         return f"║ {line}{' ' * needed} ║"
 
     # Build box
-    border = "╔" + "═" * (width - 2) + "╗"
-    divider = "╠" + "═" * (width - 2) + "╣"
-    bottom = "╚" + "═" * (width - 2) + "╝"
-
-    result = [border, pad(title), divider]
-    result.extend(pad(line) for line in body_lines)
-    result.append(bottom)
-    return "\n".join(result)
-
-
-def main() -> None:
+    bar = "═" * (width - 2)
+    border = f"╔{bar}╗"
+    divider = f"╠{bar}╣"
+    bottom = f"╚{bar}╝"
+
+    return "\n".join([
+        border,
+        pad(title, widths[0]),
+        divider,
+        *(pad(line, w) for line, w in zip(body_lines, widths[1:])),
+        bottom,
+    ])
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; reused across in-process main() calls."""
     parser = argparse.ArgumentParser(
         description="Format text in a bordered box"
     )
@@ -64,8 +78,11 @@ def main() -> None:
         default=60,
         help="Minimum box width (default: 60)"
     )
+    return parser
 
-    args = parser.parse_args()
+
+def main() -> None:
+    args = _build_parser().parse_args()
 
     output = format_box(args.title, args.body, args.width)
     print(output)
@@ -10,8 +10,13 @@ from datetime import UTC, date, datetime
 
 def to_timestamp(dt: datetime) -> str:
     """Convert datetime to ISO 8601 UTC timestamp string."""
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=UTC)
+    tz = dt.tzinfo
+    # Naive datetimes are treated as UTC: append Z rather than copying the
+    # datetime with tzinfo set just to strip the resulting "+00:00" again
+    if tz is None:
+        return dt.isoformat() + "Z"
+    if tz is UTC:
+        return dt.isoformat()[:-6] + "Z"
     return dt.isoformat().replace("+00:00", "Z")
 
 
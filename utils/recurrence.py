@@ -8,8 +8,11 @@ All datetime and recurrence logic should be centralized in this module
 to maintain consistency and limit dependency footprint.
 """
 
-from datetime import datetime, date
-from typing import List, Optional
+import re
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from itertools import islice, takewhile
+from typing import Iterator, List, Optional
 
 from dateutil.rrule import rrulestr, rrule
 from dateutil.relativedelta import relativedelta
@@ -21,6 +24,106 @@ from utils.isodatetime import (
 )
 
 
+# Well-formed UTC timestamps as produced by utils.isodatetime.to_timestamp.
+# The pattern allows days 29-31 in every month; see _is_utc_timestamp.
+_ISO_UTC_RE = re.compile(
+    r"(?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])"
+    r"T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,6})?"
+    r"(?:Z|[+-]00:00)"
+)
+
+# Any parseable rule mentions FREQ= or starts a line with an iCal property
+# (DTSTART:, RRULE:, EXDATE;..., etc.). Strings with neither are rejected
+# without invoking dateutil's parser.
+_RRULE_HINT_RE = re.compile(r"FREQ=|^\s*[A-Z-]+[:;]", re.IGNORECASE | re.MULTILINE)
+
+# Grammar of a single RRULE line as dateutil parses it: known parameter
+# names, one "=" per part, non-empty values, and FREQ somewhere. A lone
+# rule line that does not match can be rejected without a full parse.
+_RRULE_PARAM = (
+    r"(?:FREQ|INTERVAL|COUNT|UNTIL|WKST|BYSETPOS|BYMONTH|BYMONTHDAY|BYYEARDAY"
+    r"|BYEASTER|BYWEEKNO|BYWEEKDAY|BYDAY|BYHOUR|BYMINUTE|BYSECOND)=[^\s;=:]+"
+)
+_RRULE_LINE_RE = re.compile(
+    rf"(?:RRULE:)?(?=(?:[^;]*;)*FREQ=){_RRULE_PARAM}(?:;{_RRULE_PARAM})*",
+    re.IGNORECASE,
+)
+
+# Errors dateutil raises for malformed rule strings (OverflowError for
+# numbers too large for a C long, e.g. UNTIL or BYHOUR values)
+_RRULE_ERRORS = (ValueError, TypeError, IndexError, OverflowError)
+
+# Rules that advance a fixed step from dtstart (no BY*, COUNT or UNTIL
+# parts). Their occurrences are computed directly with timedelta
+# arithmetic instead of through dateutil's generic expansion.
+_FIXED_STEP_RE = re.compile(r"(?:RRULE:)?FREQ=(DAILY|WEEKLY)(?:;INTERVAL=(\d+))?", re.IGNORECASE)
+_FIXED_STEPS = {"DAILY": timedelta(days=1), "WEEKLY": timedelta(weeks=1)}
+
+# Occurrences returned when neither end nor count is given
+DEFAULT_OCCURRENCES = 100
+
+# Upper bound on occurrences generated by a single query
+MAX_OCCURRENCES = 3500
+
+
+def _parse_rule(rrule_str: str, dtstart: datetime) -> rrule:
+    """Parse an RRULE string, memoized by rule text and dtstart.
+
+    Aware datetimes at the same instant compare equal whatever their
+    tzinfo, so the tzinfo identity is part of the cache key. Otherwise a
+    caller could get back a rule expanding in another caller's timezone.
+    """
+    return _parse_rule_cached(rrule_str, dtstart, id(dtstart.tzinfo))
+
+
+@lru_cache(maxsize=512)
+def _parse_rule_cached(rrule_str: str, dtstart: datetime, tz_id: int) -> rrule:
+    """Parse an RRULE string; see _parse_rule for the cache key.
+
+    tz_id stays valid while the entry lives, since the key holds dtstart
+    and with it the tzinfo. Rules are not built with cache=True: shared
+    rules would otherwise retain every occurrence ever expanded from them.
+    """
+    return rrulestr(rrule_str, dtstart=dtstart)
+
+
+def _is_utc_timestamp(value: str) -> bool:
+    """Check whether a string is a UTC timestamp known to parse.
+
+    Matches _ISO_UTC_RE and names a real calendar date. Days up to 28
+    exist in every month; later days are checked by building the date.
+    """
+    if not _ISO_UTC_RE.fullmatch(value):
+        return False
+    if value[8:10] <= "28":
+        return True
+    try:
+        date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=512)
+def _is_valid_rrule(rrule_str: str) -> bool:
+    """Check whether an RRULE string parses, memoized by rule text."""
+    if not _RRULE_HINT_RE.search(rrule_str):
+        return False
+
+    # A single rule line (dateutil splits on whitespace) must match the
+    # RRULE grammar; property blocks like DTSTART:...\nRRULE:... skip this
+    line = rrule_str.strip()
+    if len(line.split()) == 1 and (":" not in line or line[:6].upper() == "RRULE:"):
+        if not _RRULE_LINE_RE.fullmatch(line):
+            return False
+
+    try:
+        rrulestr(rrule_str)
+        return True
+    except _RRULE_ERRORS:
+        return False
+
+
 def validate_rrule(rrule_str: str) -> bool:
     """
     Validate an iCal RRULE string.
@@ -37,11 +140,103 @@ def validate_rrule(rrule_str: str) -> bool:
         >>> validate_rrule("INVALID")
         False
     """
+    return _is_valid_rrule(rrule_str)
+
+
+@lru_cache(maxsize=512)
+def _fixed_step(rrule_str: str) -> Optional[timedelta]:
+    """Get the step between occurrences for fixed-step rules, else None."""
+    match = _FIXED_STEP_RE.fullmatch(rrule_str.strip())
+    if match is None:
+        return None
+    interval = int(match.group(2) or 1)
+    if interval < 1:
+        return None
+    return _FIXED_STEPS[match.group(1).upper()] * interval
+
+
+def _iter_fixed_step(
+    dtstart: datetime,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    step: timedelta,
+) -> Iterator[datetime]:
+    """Yield dtstart, dtstart + step, ... from start (inclusive) to end (exclusive).
+
+    Matches dateutil for the same rule: microseconds are dropped from
+    dtstart, aware datetimes step in wall-clock time, and iteration stops
+    at the end of the representable datetime range. Callers must pass a
+    start sharing dtstart's tzinfo so the skip-ahead is wall-clock too.
+    """
+    dt = dtstart.replace(microsecond=0)
     try:
-        rrulestr(rrule_str)
-        return True
-    except Exception:
-        return False
+        if start is not None and start > dt:
+            # Jump straight to the first occurrence at or after start
+            dt += -((dt - start) // step) * step
+        while end is None or dt < end:
+            yield dt
+            dt += step
+    except OverflowError:
+        return
+
+
+def iter_occurrences(
+    rrule_str: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+    dtstart: Optional[datetime] = None,
+) -> Iterator[datetime]:
+    """
+    Lazily iterate over occurrences from an RRULE string.
+
+    Prefer this over generate_occurrences when the caller may stop early
+    (previews, "next N"), since occurrences are only computed as consumed.
+    Unbounded rules with no end yield indefinitely.
+
+    By default the series begins at start. Pass dtstart to anchor the
+    series elsewhere and treat start purely as the window start; this
+    keeps INTERVAL, COUNT and BY* alignment tied to the series rather
+    than to the window being viewed.
+
+    Args:
+        rrule_str: iCal RRULE string
+        start: Start datetime for occurrence generation (inclusive, to
+            whole seconds; microseconds are ignored as in dateutil)
+        end: Optional end datetime (exclusive)
+        dtstart: Optional series start, if different from start
+
+    Returns:
+        Iterator of occurrence datetimes in chronological order
+
+    Raises:
+        ValueError: If the RRULE string is invalid
+
+    Example:
+        >>> it = iter_occurrences("FREQ=DAILY", datetime(2025, 1, 1))
+        >>> next(it)
+        datetime(2025, 1, 1, 0, 0)
+    """
+    # dateutil drops microseconds from dtstart, so the window start is
+    # taken at whole seconds on every path; otherwise a series starting at
+    # start would lose its first occurrence, or the fixed-step path would
+    # yield a time before start.
+    start = start.replace(microsecond=0)
+
+    step = _fixed_step(rrule_str)
+    if step is not None and (dtstart is None or dtstart.tzinfo is start.tzinfo):
+        if dtstart is None:
+            return _iter_fixed_step(start, None, end, step)
+        return _iter_fixed_step(dtstart, start, end, step)
+
+    # Parse eagerly so an invalid rule raises here, not on first next().
+    # The rule string may embed its own DTSTART, which overrides the one
+    # passed in, so the window is always bounded from below at start.
+    rule = _parse_rule(rrule_str, start if dtstart is None else dtstart)
+    occurrences = rule.xafter(start, inc=True)
+
+    if end is None:
+        return occurrences
+    return takewhile(end.__gt__, occurrences)
 
 
 def generate_occurrences(
@@ -49,15 +244,26 @@ def generate_occurrences(
     start: datetime,
     end: Optional[datetime] = None,
     count: Optional[int] = None,
+    max_count: int = MAX_OCCURRENCES,
+    dtstart: Optional[datetime] = None,
 ) -> List[datetime]:
     """
     Generate occurrences from an RRULE string.
 
+    Iteration stops at whichever bound is reached first, so end and count
+    can be combined (e.g. "at most 5 occurrences before March").
+
     Args:
         rrule_str: iCal RRULE string
-        start: Start datetime for occurrence generation
+        start: Start datetime for occurrence generation (inclusive, to
+            whole seconds)
         end: Optional end datetime (exclusive)
         count: Optional maximum number of occurrences to generate
+        max_count: Safety cap on occurrences returned when count is not
+            given, guarding against unbounded rules queried over very long
+            windows
+        dtstart: Optional series start, if different from start (see
+            iter_occurrences)
 
     Returns:
         List of datetime objects representing occurrences
@@ -67,20 +273,22 @@ def generate_occurrences(
         >>> generate_occurrences("FREQ=MONTHLY;BYDAY=2FR", start, count=3)
         [datetime(2025, 1, 10, 0, 0), datetime(2025, 2, 14, 0, 0), ...]
     """
-    rule = rrulestr(rrule_str, dtstart=start)
-
     if count:
-        return list(rule[:count])
-    elif end:
-        return list(rule.between(start, end))
+        limit = count
+    elif end is not None:
+        limit = max_count
     else:
-        # Default to 100 occurrences if no limit specified
-        return list(rule[:100])
+        # Default to 100 occurrences (within max_count) if no limit specified
+        limit = min(DEFAULT_OCCURRENCES, max_count)
+
+    occurrences = iter_occurrences(rrule_str, start, end, dtstart)
+    return list(islice(occurrences, max(limit, 0)))
 
 
 def get_next_occurrence(
     rrule_str: str,
     after: datetime,
+    dtstart: Optional[datetime] = None,
 ) -> Optional[datetime]:
     """
     Get the next occurrence after a given datetime.
@@ -88,14 +296,16 @@ def get_next_occurrence(
     Args:
         rrule_str: iCal RRULE string
         after: Get next occurrence after this datetime
+        dtstart: Optional series start; defaults to after
 
     Returns:
         Next occurrence datetime, or None if no more occurrences
     """
-    rule = rrulestr(rrule_str, dtstart=after)
+    occurrences = iter_occurrences(rrule_str, after, dtstart=dtstart)
     try:
-        return rule.after(after, inc=False)
-    except Exception:
+        # The window starts at `after`, which may itself be an occurrence
+        return next((dt for dt in occurrences if dt > after), None)
+    except ValueError:
         return None
 
 
@@ -136,6 +346,21 @@ def is_valid_recurrence_window(
     Raises:
         ValueError: If dates cannot be parsed
     """
+    # Fast paths for well-formed UTC timestamps; anything else is parsed
+    if _is_utc_timestamp(valid_from):
+        # Open-ended windows are valid once valid_from is well-formed
+        if not valid_until:
+            return True
+        # UTC timestamps with the same layout (fraction digits and zone
+        # suffix) order lexicographically, so compare without parsing
+        if (
+            len(valid_from) == len(valid_until)
+            and valid_from[-6] == valid_until[-6]
+            and valid_from[-1] == valid_until[-1]
+            and _is_utc_timestamp(valid_until)
+        ):
+            return valid_from < valid_until
+
     try:
         from_date = parse_isodatetime(valid_from)
         if valid_until:
@@ -14,36 +14,15 @@ This approach:
 - Reduces attack surface by confining third-party crypto imports
 """
 
-import secrets
-import uuid as _uuid
 from typing import Literal
 
-# ============================================================================
-# UUID Generation
-# ============================================================================
-
-
-def generate_uuid() -> str:
-    """
-    Generate a random UUID v4 as a string.
-
-    Use this for all entity IDs, user IDs, API key IDs, etc.
-
-    Returns:
-        UUID v4 as a string (e.g., "550e8400-e29b-41d4-a716-446655440000")
-
-    Example:
-    ```python
-    user_id = generate_uuid()
-    # Returns: "550e8400-e29b-41d4-a716-446655440000"
-    ```
-
-    Note:
-        This is the ONLY place in the codebase that imports uuid4.
-        All other modules should use this function instead.
-    """
-    return str(_uuid.uuid4())
+# generate_uuid lives in utils.uid; re-exported so secret.generate_uuid()
+# callers share the single implementation
+from utils.uid import generate_uuid as generate_uuid
 
+# The stdlib secrets module is imported inside the functions that use it.
+# It pulls in random, hmac and base64, which processes that import utils
+# but never mint secrets (CLIs, cold starts) should not pay for.
 
 # ============================================================================
 # API Key Generation
@@ -53,6 +32,10 @@ def generate_uuid() -> str:
 # Example: mg_sk_agent_abc123def456...
 API_KEY_PREFIX = "mg_sk"
 API_KEY_RANDOM_BYTES = 32  # Number of random bytes (hex-encoded = 64 chars)
+API_KEY_PREFIX_LENGTH = 12  # len("mg_sk_agent_")
+
+# Display prefix of agent keys; returned as-is instead of slicing a copy
+_AGENT_KEY_PREFIX = f"{API_KEY_PREFIX}_agent_"
 
 
 def generate_api_key(type: Literal["agent"] = "agent") -> str:
@@ -82,8 +65,9 @@ def generate_api_key(type: Literal["agent"] = "agent") -> str:
         This is the ONLY place in the codebase that generates API keys.
         All other modules should use this function instead.
     """
-    random_part = secrets.token_hex(API_KEY_RANDOM_BYTES)
-    return f"{API_KEY_PREFIX}_{type}_{random_part}"
+    from secrets import token_hex
+
+    return f"{API_KEY_PREFIX}_{type}_{token_hex(API_KEY_RANDOM_BYTES)}"
 
 
 def get_api_key_prefix(api_key: str) -> str:
@@ -104,7 +88,31 @@ def get_api_key_prefix(api_key: str) -> str:
     # Returns: "mg_sk_agent_"
     ```
     """
-    return api_key[:12]
+    if api_key.startswith(_AGENT_KEY_PREFIX):
+        return _AGENT_KEY_PREFIX
+    return api_key[:API_KEY_PREFIX_LENGTH]
+
+
+def split_api_key(api_key: str) -> tuple[str, str]:
+    """
+    Split an API key into its display prefix and random part.
+
+    For auth paths that need both the prefix (lookup) and the remainder
+    (verification) without slicing the key twice.
+
+    Args:
+        api_key: Full API key
+
+    Returns:
+        Tuple of (prefix, random part)
+
+    Example:
+    ```python
+    prefix, body = split_api_key("mg_sk_agent_abc123def456...")
+    # Returns: ("mg_sk_agent_", "abc123def456...")
+    ```
+    """
+    return get_api_key_prefix(api_key), api_key[API_KEY_PREFIX_LENGTH:]
 
 
 # ============================================================================
@@ -135,7 +143,52 @@ def generate_token(num_bytes: int = 32) -> str:
     # Returns: "9a2b8c7d..."
     ```
     """
-    return secrets.token_hex(num_bytes)
+    from secrets import token_hex
+
+    return token_hex(num_bytes)
+
+
+def generate_tokens(n: int, num_bytes: int = 32) -> list[str]:
+    """
+    Generate several cryptographically secure random tokens at once.
+
+    Draws all randomness in one call rather than one per token, for bulk
+    issuing (e.g. seeding many verification tokens).
+
+    Args:
+        n: Number of tokens to generate
+        num_bytes: Random bytes per token (default 32, hex-encoded = 64 chars)
+
+    Returns:
+        List of hex-encoded random tokens
+
+    Example:
+    ```python
+    tokens = generate_tokens(3, num_bytes=16)
+    # Returns: ["9a2b8c7d...", "1f4e6a0b...", "c3d5e7f9..."]
+    ```
+    """
+    from secrets import token_hex
+
+    width = 2 * num_bytes
+    if not width:
+        # Empty tokens, as generate_token(0) returns; range() needs a step
+        return [""] * n
+    hex_data = token_hex(n * num_bytes)
+    return [hex_data[i:i + width] for i in range(0, n * width, width)]
+
+
+# Password alphabet (62 characters). Random bytes are masked to 6 bits
+# (0-63) and values >= 62 are rejected, so every character is equally
+# likely. The translate table maps each byte to its character in one pass.
+PASSWORD_ALPHABET = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+_PASSWORD_TABLE = bytes(
+    PASSWORD_ALPHABET[b & 0x3F] if (b & 0x3F) < len(PASSWORD_ALPHABET) else 0
+    for b in range(256)
+)
+_PASSWORD_REJECT = bytes(
+    b for b in range(256) if (b & 0x3F) >= len(PASSWORD_ALPHABET)
+)
 
 
 def generate_password(length: int = 16) -> str:
@@ -159,12 +212,16 @@ def generate_password(length: int = 16) -> str:
     # Returns: "aB3xY9mK2pQ"
     ```
     """
-    # Ensure we have both letters and digits
-    chars = []
-    for _ in range(length):
-        chars.append(secrets.choice("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"))
+    from secrets import token_bytes
+
+    # Draw random bytes in bulk and rejection-sample them. Only ~3% of
+    # bytes are rejected, so one draw nearly always suffices.
+    chars = b""
+    while len(chars) < length:
+        raw = token_bytes(2 * (length - len(chars)))
+        chars += raw.translate(_PASSWORD_TABLE, _PASSWORD_REJECT)
 
-    return ''.join(chars)
+    return chars[:length].decode("ascii")
 
 
 # ============================================================================
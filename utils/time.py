@@ -4,10 +4,14 @@ Provides date/time functions for time horizon computation and other
 time-based operations.
 """
 
-from datetime import date, timedelta
+from datetime import date
+from typing import Final
 
 # Epoch for days-since calculations (RFC-002)
-EPOCH = date(2020, 1, 1)
+EPOCH: Final = date(2020, 1, 1)
+
+# Day counts are computed as ordinal differences, avoiding timedelta objects
+_EPOCH_ORDINAL: Final = EPOCH.toordinal()
 
 
 def current_day() -> int:
@@ -20,7 +24,7 @@ def current_day() -> int:
         >>> current_day()  # If today is 2026-02-07
         2229
     """
-    return (date.today() - EPOCH).days
+    return date.today().toordinal() - _EPOCH_ORDINAL
 
 
 def day_to_date(day: int) -> date:
@@ -32,8 +36,16 @@ def day_to_date(day: int) -> date:
     Returns:
         Corresponding date
 
+    Raises:
+        OverflowError: If the date is outside the supported range
+
     Examples:
         >>> day_to_date(2229)
         datetime.date(2026, 2, 7)
     """
-    return EPOCH + timedelta(days=day)
+    try:
+        return date.fromordinal(_EPOCH_ORDINAL + day)
+    except ValueError:
+        # fromordinal reports range errors as ValueError; keep the
+        # OverflowError that date + timedelta arithmetic raises
+        raise OverflowError("date value out of range") from None
@@ -9,11 +9,27 @@ Per PRD v6:
 - API layer adds/strips prefixes at boundary
 """
 
-from uuid import uuid4
+import os
+from typing import Final
 
 # Prefix constants (PRD v6 UUID namespaces)
-UUID_PREFIX_CORE = "core_"
-UUID_PREFIX_SOIL = "soil_"
+UUID_PREFIX_CORE: Final = "core_"
+UUID_PREFIX_SOIL: Final = "soil_"
+
+# All known prefixes, for single-call str.startswith checks
+_KNOWN_PREFIXES: Final = (UUID_PREFIX_CORE, UUID_PREFIX_SOIL)
+_KNOWN_PREFIXES_BYTES: Final = tuple(p.encode() for p in _KNOWN_PREFIXES)
+
+
+def _random_v4() -> bytearray:
+    """Draw 16 random bytes and set the UUID version 4 / RFC 4122 variant bits.
+
+    Equivalent to uuid.uuid4() without constructing a uuid.UUID object.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return b
 
 
 def generate_uuid() -> str:
@@ -22,10 +38,55 @@ def generate_uuid() -> str:
     The prefix is added at the API boundary, not in storage.
     Storage uses plain UUID for simplicity and compatibility.
 
+    This is the single UUID generator for the codebase; utils.secret
+    re-exports it.
+
     Returns:
         Plain UUID4 string (e.g., "a1b2c3d4-e5f6-7890-abcd-ef1234567890")
     """
-    return str(uuid4())
+    h = _random_v4().hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Byte maps applying the version 4 / RFC 4122 variant bits, used to fix up
+# every UUID in a batch with one C-level translate per field
+_VERSION_4 = bytes((b & 0x0F) | 0x40 for b in range(256))
+_VARIANT_RFC4122 = bytes((b & 0x3F) | 0x80 for b in range(256))
+
+
+def generate_uuids(n: int) -> list[str]:
+    """Generate n random UUID v4 strings (plain, no prefix).
+
+    For bulk creation (imports, fixtures): all randomness comes from one
+    os.urandom call instead of one per UUID.
+
+    Args:
+        n: Number of UUIDs to generate
+
+    Returns:
+        List of plain UUID4 strings
+    """
+    raw = bytearray(os.urandom(16 * n))
+    raw[6::16] = raw[6::16].translate(_VERSION_4)
+    raw[8::16] = raw[8::16].translate(_VARIANT_RFC4122)
+    h = raw.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-"
+        f"{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
+
+
+def generate_uuid_bytes() -> bytes:
+    """Generate a random UUID v4 as 16 raw bytes.
+
+    For binary storage columns, which take 16 bytes per row instead of the
+    36-character string form.
+
+    Returns:
+        UUID4 bytes (uuid.UUID(bytes=...) gives the string form)
+    """
+    return bytes(_random_v4())
 
 
 def add_core_prefix(uuid: str) -> str:
@@ -39,7 +100,7 @@ def add_core_prefix(uuid: str) -> str:
     Returns:
         UUID with core_ prefix (e.g., "core_a1b2c3d4-e5f6-7890-abcd-ef1234567890")
     """
-    if uuid.startswith(UUID_PREFIX_CORE) or uuid.startswith(UUID_PREFIX_SOIL):
+    if uuid.startswith(_KNOWN_PREFIXES):
         return uuid
     return f"{UUID_PREFIX_CORE}{uuid}"
 
@@ -53,7 +114,7 @@ def add_soil_prefix(uuid: str) -> str:
     Returns:
         UUID with soil_ prefix
     """
-    if uuid.startswith(UUID_PREFIX_SOIL) or uuid.startswith(UUID_PREFIX_CORE):
+    if uuid.startswith(_KNOWN_PREFIXES):
         return uuid
     return f"{UUID_PREFIX_SOIL}{uuid}"
 
@@ -70,9 +131,25 @@ def strip_prefix(uuid: str) -> str:
         Plain UUID string (e.g., "a1b2c3d4-e5f6-7890-abcd-ef1234567890")
     """
     if uuid.startswith(UUID_PREFIX_CORE):
-        return uuid[len(UUID_PREFIX_CORE):]
-    if uuid.startswith(UUID_PREFIX_SOIL):
-        return uuid[len(UUID_PREFIX_SOIL):]
+        return uuid.removeprefix(UUID_PREFIX_CORE)
+    return uuid.removeprefix(UUID_PREFIX_SOIL)
+
+
+def strip_prefix_bytes(uuid: bytes) -> bytes:
+    """Remove core_ or soil_ prefix from a UUID given as bytes.
+
+    For request paths and headers that arrive as bytes: strip before
+    decoding so only the plain 36-byte UUID needs converting to str.
+
+    Args:
+        uuid: Prefixed or plain UUID bytes
+
+    Returns:
+        Plain UUID bytes (e.g., b"a1b2c3d4-e5f6-7890-abcd-ef1234567890")
+    """
+    for prefix in _KNOWN_PREFIXES_BYTES:
+        if uuid.startswith(prefix):
+            return uuid[len(prefix):]
     return uuid
 
 
@@ -88,4 +165,4 @@ def has_soil_prefix(uuid: str) -> bool:
 
 def has_prefix(uuid: str) -> bool:
     """Check if UUID has any known prefix."""
-    return has_core_prefix(uuid) or has_soil_prefix(uuid)
+    return uuid.startswith(_KNOWN_PREFIXES)